@@ -1,26 +1,107 @@
-import random
+import copy
+import hashlib
+import pickle
+import time
 import numpy as np
 import logging
-from typing import List, Dict, Any, Tuple, Callable, Optional
+import multiprocessing
+from multiprocessing.pool import Pool, ThreadPool
+from collections import OrderedDict
+from functools import partial
+from typing import List, Dict, Any, Sequence, Tuple, Callable, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import cloudpickle
+except ImportError:  # only needed to ship lambdas/closures to worker processes
+    cloudpickle = None
+
 from agents.models.agent import Agent
+from agents.mutation_kernel import build_mutate_function, mutation_type
 
 logger = logging.getLogger(__name__)
 
 
+class _CloudPickled:
+    """Wrap a callable so it is serialised with cloudpickle (e.g. lambdas, closures)"""
+    
+    def __init__(self, fn: Callable):
+        self.fn = fn
+    
+    def __call__(self, *args, **kwargs):
+        return self.fn(*args, **kwargs)
+    
+    def __reduce__(self):
+        # Unpickling restores the wrapped callable itself
+        return cloudpickle.loads, (cloudpickle.dumps(self.fn),)
+
+
+def _picklable(fn: Callable) -> Callable:
+    """Return fn, wrapped for cloudpickle if the standard pickler cannot handle it"""
+    try:
+        pickle.dumps(fn)
+        return fn
+    except (pickle.PicklingError, AttributeError, TypeError):
+        if cloudpickle is None:
+            raise
+        return _CloudPickled(fn)
+
+
+def _evaluate_indexed(fitness_function: Callable[[Agent], float],
+                      item: Tuple[int, Agent]) -> Tuple[int, float]:
+    """Evaluate one agent in a worker, keeping its index for unordered results"""
+    index, agent = item
+    return index, fitness_function(agent)
+
+
+# Fitness function of a worker process, installed once by _worker_init so it
+# is not pickled with every task
+_FITNESS: Optional[Callable[[Agent], float]] = None
+
+
+def _worker_init(fitness_function: Callable[[Agent], float]) -> None:
+    """Pool initializer storing the fitness function in the worker process"""
+    global _FITNESS
+    _FITNESS = fitness_function
+
+
+# Agent attributes a fitness function may set besides the returned fitness
+_EVALUATION_FIELDS = ("metrics", "fitness_score", "last_evaluation_timestamp")
+
+
+def _worker_eval(item: Tuple[int, Agent]) -> Tuple[int, float, Tuple[Any, ...]]:
+    """
+    Evaluate one agent with the worker's installed fitness function.
+    
+    The agent is a copy living in the worker, so the evaluation fields the
+    fitness function wrote to it are returned for the parent to apply.
+    """
+    index, agent = item
+    fitness = _FITNESS(agent)
+    return index, fitness, tuple(getattr(agent, name) for name in _EVALUATION_FIELDS)
+
+
 @dataclass
 class EvolutionHistory:
     """Track the performance and statistics across generations"""
     generation_stats: List[Dict[str, Any]] = field(default_factory=list)
-    best_agent_history: List[Agent] = field(default_factory=list)
+    best_records: List[Dict[str, Any]] = field(default_factory=list)
+    best_ever: Optional[Agent] = None
     start_time: datetime = field(default_factory=datetime.now)
+    # Monotonic baseline for elapsed_time, unaffected by wall-clock adjustments
+    start_counter: float = field(default_factory=time.perf_counter)
     
     def add_generation(self, generation: int, population: List[Agent], 
                     best_fitness: float, avg_fitness: float, 
-                    diversity_metric: float) -> None:
-        """Record statistics for a completed generation"""
+                    diversity_metric: float,
+                    best_agent: Optional[Agent] = None) -> None:
+        """
+        Record statistics for a completed generation.
+        
+        The best agent is looked up in the population unless the caller
+        already knows it and passes it as best_agent.
+        """
         stats = {
             "generation": generation,
             "timestamp": datetime.now(),
@@ -28,13 +109,23 @@ class EvolutionHistory:
             "average_fitness": avg_fitness,
             "population_size": len(population),
             "diversity_metric": diversity_metric,
-            "elapsed_time": (datetime.now() - self.start_time).total_seconds()
+            "elapsed_time": time.perf_counter() - self.start_counter
         }
         self.generation_stats.append(stats)
         
-        # Track the best agent from this generation
-        best_agent = max(population, key=lambda x: x.fitness)
-        self.best_agent_history.append(best_agent.clone())
+        # Track the best agent from this generation as a lightweight record,
+        # keeping a full copy only of the best agent seen so far
+        if best_agent is None:
+            best_agent = max((agent for agent in population if agent.fitness is not None),
+                            key=lambda x: x.fitness)
+        self.best_records.append({
+            "generation": generation,
+            "agent_id": best_agent.id,
+            "fitness": best_agent.fitness,
+            "strategy_params": dict(best_agent.strategy_params)
+        })
+        if self.best_ever is None or best_agent.fitness > self.best_ever.fitness:
+            self.best_ever = best_agent.clone()
         
     def get_last_generation_stats(self) -> Dict[str, Any]:
         """Return the statistics of the most recent generation"""
@@ -44,9 +135,7 @@ class EvolutionHistory:
     
     def get_best_agent_ever(self) -> Optional[Agent]:
         """Return the best agent across all generations"""
-        if not self.best_agent_history:
-            return None
-        return max(self.best_agent_history, key=lambda x: x.fitness)
+        return self.best_ever
 
 
 class EvolutionEngine:
@@ -58,7 +147,11 @@ class EvolutionEngine:
                 crossover_rate: float = 0.7,
                 mutation_rate: float = 0.1,
                 elitism_count: int = 2,
-                fitness_function: Callable[[Agent], float] = None):
+                fitness_function: Callable[[Agent], float] = None,
+                n_workers: Optional[int] = None,
+                use_threads: bool = False,
+                fitness_cache_size: int = 0,
+                seed: Optional[int] = None):
         """
         Initialize the evolution engine.
         
@@ -68,7 +161,24 @@ class EvolutionEngine:
             crossover_rate: Probability of crossover occurring
             mutation_rate: Probability of mutation occurring
             elitism_count: Number of top agents to carry over unchanged
-            fitness_function: Function to evaluate agent fitness
+            fitness_function: Function to evaluate agent fitness. With worker
+                processes it must be picklable, or cloudpickle must be installed
+            n_workers: Number of parallel workers for fitness evaluation
+                (None or 1 evaluates serially). Use the engine as a context
+                manager to release the pool when the run is done. Worker
+                processes evaluate copies of the agents; the fitness and the
+                metrics, fitness_score and last_evaluation_timestamp the
+                fitness function sets are copied back, other changes are lost
+            use_threads: Use a thread pool instead of a process pool, for
+                fitness functions that release the GIL
+            fitness_cache_size: Maximum number of cached fitness values keyed
+                by strategy parameters (0, the default, disables caching).
+                Only enable it for deterministic fitness functions that
+                depend on nothing but the strategy parameters: agents with
+                parameters seen before are not passed to the fitness function
+                again but get the cached fitness plus a copy of the metrics,
+                fitness_score and last_evaluation_timestamp it set
+            seed: Seed for the engine's random number generator
         """
         self.population_size = population_size
         self.tournament_size = tournament_size
@@ -76,9 +186,85 @@ class EvolutionEngine:
         self.mutation_rate = mutation_rate
         self.elitism_count = elitism_count
         self.fitness_function = fitness_function
-        self.population: List[Agent] = []
+        self._population: List[Agent] = []
         self.history = EvolutionHistory()
         self.current_generation = 0
+        self.n_workers = n_workers
+        self.use_threads = use_threads
+        self._pool: Optional[Pool] = None
+        self._pool_fitness_function: Optional[Callable[[Agent], float]] = None
+        self.fitness_cache_size = fitness_cache_size
+        # Parameter hash -> (fitness, values of _EVALUATION_FIELDS)
+        self._fitness_cache: "OrderedDict[bytes, Tuple[float, tuple]]" = OrderedDict()
+        self._cached_fitness_function: Optional[Callable[[Agent], float]] = None
+        self.rng = np.random.default_rng(seed)
+        
+        # Mutation function generated for the population's parameter schema
+        self._mutate_fn: Optional[Callable[..., bool]] = None
+        
+        # Fitness of each agent in the population, set by evaluate_population
+        # and invalidated whenever the population is replaced
+        self._fitness_vec: Optional[np.ndarray] = None
+    
+    @property
+    def population(self) -> List[Agent]:
+        """The agents of the current generation"""
+        return self._population
+    
+    @population.setter
+    def population(self, agents: List[Agent]) -> None:
+        # A new population invalidates everything derived from the old one
+        self._population = agents
+        self._fitness_vec = None
+        self._specialise_mutation()
+    
+    def __enter__(self) -> 'EvolutionEngine':
+        """Start the worker pool so it is shared by every generation of the run"""
+        if self.n_workers and self.n_workers > 1:
+            self._get_pool()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # After an error, queued evaluations may never be collected, so stop
+        # the workers instead of waiting for them to drain
+        self.shutdown(terminate=exc_type is not None)
+    
+    def _get_pool(self) -> Pool:
+        """Lazily create the worker pool used for parallel evaluation"""
+        # Worker processes hold the fitness function they were started with
+        if (self._pool is not None and not self.use_threads
+                and self._pool_fitness_function is not self.fitness_function):
+            self.shutdown()
+        
+        if self._pool is None:
+            if self.use_threads:
+                self._pool = ThreadPool(self.n_workers)
+            else:
+                # Ship the fitness function once per worker rather than per task
+                self._pool = multiprocessing.Pool(
+                    self.n_workers,
+                    initializer=_worker_init,
+                    initargs=(_picklable(self.fitness_function),)
+                )
+                self._pool_fitness_function = self.fitness_function
+        return self._pool
+    
+    def shutdown(self, terminate: bool = False) -> None:
+        """
+        Release the worker pool, if one was created.
+        
+        Args:
+            terminate: Stop the workers immediately instead of letting them
+                finish outstanding tasks
+        """
+        if self._pool is not None:
+            if terminate:
+                self._pool.terminate()
+            else:
+                self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_fitness_function = None
     
     def initialize_population(self, agent_factory: Callable[[], Agent]) -> None:
         """
@@ -90,23 +276,154 @@ class EvolutionEngine:
         self.population = [agent_factory() for _ in range(self.population_size)]
         self.current_generation = 0
         self.history = EvolutionHistory()
+        self._fitness_cache.clear()
         
         # Reset evolution history
         logger.info(f"Initialized population with {self.population_size} agents")
     
+    def _specialise_mutation(self) -> None:
+        """Generate the mutation function for the population's parameter schema"""
+        # The schema is fixed for the run, so specialise mutation to it once.
+        # Every agent must agree on the keys and on how each value mutates,
+        # otherwise the generated code would apply the wrong rule
+        self._mutate_fn = None
+        if not self.population:
+            return
+        first_params = self.population[0].strategy_params
+        first_keys = tuple(first_params)
+        first_types = tuple(map(type, first_params.values()))
+        schema = [(key, mutation_type(value)) for key, value in first_params.items()]
+        for agent in self.population:
+            params = agent.strategy_params
+            # Same keys in the same order with the same exact types is the
+            # common case and needs no per-value Python calls
+            if tuple(params) == first_keys and tuple(map(type, params.values())) == first_types:
+                continue
+            if params.keys() != first_params.keys():
+                return
+            if any(mutation_type(params[key]) is not kind for key, kind in schema):
+                return
+        self._mutate_fn = build_mutate_function(first_params)
+    
     def evaluate_population(self) -> None:
         """Evaluate the fitness of each agent in the population"""
         if not self.fitness_function:
             raise ValueError("Fitness function is not defined")
+        
+        # Cached values are only valid for the function that produced them
+        if self._cached_fitness_function is not self.fitness_function:
+            self._fitness_cache.clear()
+            self._cached_fitness_function = self.fitness_function
             
+        # Only evaluate agents that have not already been evaluated, reusing
+        # cached results for parameter sets seen before. The cache is read and
+        # written only here, in the coordinating thread, before and after work
+        # is dispatched; workers never touch it, so it needs no lock or shards
+        misses: Dict[Any, List[Agent]] = {}
+        pending = 0
         for agent in self.population:
-            if agent.fitness is None:  # Only evaluate if not already evaluated
-                agent.fitness = self.fitness_function(agent)
+            if agent.fitness is not None:
+                continue
+            pending += 1
+            if not self.fitness_cache_size:
+                misses[id(agent)] = [agent]
+                continue
+            key = self._param_key(agent)
+            if key is None:
+                misses[id(agent)] = [agent]
+                continue
+            cached = self._fitness_cache.get(key)
+            if cached is not None:
+                self._fitness_cache.move_to_end(key)
+                self._apply_evaluation(agent, *cached)
+            else:
+                misses.setdefault(key, []).append(agent)
+        
+        keys = list(misses)
+        results = self._compute_fitness([misses[key][0] for key in keys])
+        for key, fitness in zip(keys, results):
+            # Agents sharing parameters with the evaluated one get its outcome
+            evaluated, *duplicates = misses[key]
+            evaluated.fitness = fitness
+            if duplicates or self.fitness_cache_size:
+                fields = tuple(getattr(evaluated, name) for name in _EVALUATION_FIELDS)
+                for agent in duplicates:
+                    self._apply_evaluation(agent, fitness, fields)
+                if self.fitness_cache_size:
+                    self._cache_fitness(key, fitness, fields)
+        
+        self._fitness_vec = np.fromiter((agent.fitness for agent in self.population),
+                                        dtype=np.float64, count=len(self.population))
         
         # Log some stats about the evaluation
-        fitnesses = [agent.fitness for agent in self.population]
-        logger.info(f"Population evaluation - Avg fitness: {np.mean(fitnesses):.4f}, "
-                    f"Best: {np.max(fitnesses):.4f}, Worst: {np.min(fitnesses):.4f}")
+        if pending:
+            fitnesses = self._fitness_vec
+            logger.info(f"Population evaluation - Avg fitness: {fitnesses.mean():.4f}, "
+                        f"Best: {fitnesses.max():.4f}, Worst: {fitnesses.min():.4f}")
+    
+    def _fitness_array(self) -> np.ndarray:
+        """Collect the evaluated fitness values of the population into one array"""
+        return np.fromiter(
+            (agent.fitness for agent in self.population if agent.fitness is not None),
+            dtype=np.float64
+        )
+    
+    def _compute_fitness(self, agents: List[Agent]) -> List[float]:
+        """Run the fitness function over agents, in parallel if configured"""
+        if self.n_workers and self.n_workers > 1 and len(agents) > 1:
+            pool = self._get_pool()
+            
+            # Chunk tasks to keep every worker busy while limiting pickling
+            # round-trips, and collect results as soon as they are ready
+            chunksize = max(1, len(agents) // (4 * self.n_workers))
+            results = [0.0] * len(agents)
+            if self.use_threads:
+                evaluate = partial(_evaluate_indexed, self.fitness_function)
+                for index, fitness in pool.imap_unordered(evaluate, enumerate(agents),
+                                                          chunksize=chunksize):
+                    results[index] = fitness
+            else:
+                for index, fitness, fields in pool.imap_unordered(
+                        _worker_eval, enumerate(agents), chunksize=chunksize):
+                    results[index] = fitness
+                    for name, value in zip(_EVALUATION_FIELDS, fields):
+                        setattr(agents[index], name, value)
+            return results
+        return [self.fitness_function(agent) for agent in agents]
+    
+    @staticmethod
+    def _param_key(agent: Agent) -> Optional[bytes]:
+        """
+        Hash of an agent's strategy parameters, or None if they cannot be keyed.
+        
+        The parameters are pickled rather than repr()'d, since NumPy arrays
+        abbreviate their repr and different values would collide. Keys are
+        sorted where they are comparable so insertion order does not matter.
+        """
+        params = agent.strategy_params
+        try:
+            items = sorted(params.items(), key=lambda item: item[0])
+        except TypeError:
+            items = list(params.items())
+        try:
+            canonical = pickle.dumps(items, protocol=5)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
+    @staticmethod
+    def _apply_evaluation(agent: Agent, fitness: float, fields: Tuple[Any, ...]) -> None:
+        """Give an agent the outcome of an evaluation of equal parameters"""
+        agent.fitness = fitness
+        for name, value in zip(_EVALUATION_FIELDS, fields):
+            setattr(agent, name, copy.copy(value))
+    
+    def _cache_fitness(self, key: bytes, fitness: float, fields: Tuple[Any, ...]) -> None:
+        """Store an evaluation outcome, evicting the least recently used entries"""
+        self._fitness_cache[key] = (fitness, tuple(copy.copy(value) for value in fields))
+        self._fitness_cache.move_to_end(key)
+        while len(self._fitness_cache) > self.fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
     
     def tournament_selection(self) -> Agent:
         """
@@ -115,38 +432,113 @@ class EvolutionEngine:
         Returns:
             The selected agent
         """
-        tournament = random.sample(self.population, self.tournament_size)
-        return max(tournament, key=lambda agent: agent.fitness)
+        fitnesses = self._fitness_vec
+        if fitnesses is None or fitnesses.size != len(self.population):
+            fitnesses = self._current_fitness_vec()
+        
+        # Contestants are drawn with replacement in a single call. Members may
+        # have been changed in place since the vector was built, so check the
+        # contestants against it before trusting it
+        contestants = self.rng.integers(0, len(self.population), size=self.tournament_size)
+        if any(self.population[i].fitness != fitness
+               for i, fitness in zip(contestants.tolist(), fitnesses[contestants].tolist())):
+            fitnesses = self._current_fitness_vec()
+        return self.population[contestants[fitnesses[contestants].argmax()]]
+    
+    def _current_fitness_vec(self) -> np.ndarray:
+        """
+        Rebuild the fitness vector from the agents of the current population,
+        evaluating any agent that has no fitness.
+        
+        Returns:
+            The fitness of each agent in the population
+        """
+        fitnesses = np.fromiter(
+            (np.nan if agent.fitness is None else agent.fitness for agent in self.population),
+            dtype=np.float64, count=len(self.population))
+        if np.isnan(fitnesses).any():
+            self.evaluate_population()
+        else:
+            self._fitness_vec = fitnesses
+        return self._fitness_vec
+    
+    def _batch_tournament(self, count: int) -> np.ndarray:
+        """
+        Run several tournament selections at once.
+        
+        Args:
+            count: Number of tournaments to run
+            
+        Returns:
+            Population indices of the tournament winners
+        """
+        contestants = self.rng.integers(0, len(self.population),
+                                        size=(count, self.tournament_size))
+        best = self._fitness_vec[contestants].argmax(axis=1)
+        return contestants[np.arange(count), best]
+    
+    def _elite_indices(self) -> np.ndarray:
+        """
+        Find the elitism_count fittest agents without sorting the population.
+        
+        Returns:
+            Population indices of the elites, fittest first
+        """
+        elite_count = min(self.elitism_count, len(self.population))
+        if elite_count <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        # Partition the top elite_count to the front in O(N), then order just those
+        top = np.argpartition(-self._fitness_vec, elite_count - 1)[:elite_count]
+        return top[np.argsort(-self._fitness_vec[top], kind="stable")]
     
     def create_next_generation(self) -> None:
         """Create the next generation through selection, crossover, and mutation"""
         # Ensure the population is evaluated
         self.evaluate_population()
         
-        # Sort population by fitness (descending)
-        sorted_population = sorted(self.population, key=lambda x: x.fitness, reverse=True)
         new_population = []
         
         # Elitism: directly carry over the best agents
-        elites = sorted_population[:self.elitism_count]
-        new_population.extend([elite.clone() for elite in elites])
+        new_population.extend([self.population[i].clone() for i in self._elite_indices()])
         
-        # Create the rest of the population through selection, crossover, and mutation
-        while len(new_population) < self.population_size:
+        # Create the rest of the population through selection, crossover, and
+        # mutation. Draw all parents and random decisions for the generation up front
+        count = self.population_size - len(new_population)
+        parents = self._batch_tournament(2 * count)
+        crossover_draws = self.rng.random(count)
+        clone_draws = self.rng.random(count)
+        mutating = self.rng.random(count) < self.mutation_rate
+        if self._mutate_fn is not None:
+            # One batch of draws for every mutation of the generation
+            mutation_rows = iter(self.rng.random(
+                (int(mutating.sum()), self._mutate_fn.n_draws)).tolist())
+        
+        for i in range(count):
             # Select parents
-            parent1 = self.tournament_selection()
-            parent2 = self.tournament_selection()
+            parent1 = self.population[parents[i]]
+            parent2 = self.population[parents[count + i]]
             
             # Create offspring
-            if random.random() < self.crossover_rate:
-                offspring = parent1.crossover(parent2)
+            if crossover_draws[i] < self.crossover_rate:
+                if type(parent1).crossover is Agent.crossover:
+                    offspring = parent1.crossover(parent2, rng=self.rng)
+                else:
+                    offspring = parent1.crossover(parent2)
             else:
                 # If no crossover, clone one of the parents
-                offspring = parent1.clone() if random.random() < 0.5 else parent2.clone()
+                offspring = parent1.clone() if clone_draws[i] < 0.5 else parent2.clone()
             
-            # Apply mutation with some probability
-            if random.random() < self.mutation_rate:
-                offspring.mutate()
+            # Apply mutation with some probability. Crossover offspring start
+            # unevaluated and mutate() clears fitness only if a parameter
+            # changed, so untouched clones keep their parent's fitness
+            if mutating[i]:
+                if type(offspring).mutate is not Agent.mutate:
+                    offspring.mutate()
+                elif self._mutate_fn is not None:
+                    offspring.mutate(mutate_fn=self._mutate_fn, draws=next(mutation_rows))
+                else:
+                    offspring.mutate(rng=self.rng)
             
             # Add to new population
             new_population.append(offspring)
@@ -155,34 +547,56 @@ class EvolutionEngine:
         if len(new_population) > self.population_size:
             new_population = new_population[:self.population_size]
         
-        # Update population and generation counter
-        self.population = new_population
+        # Update population and generation counter. Agent's operators keep each
+        # parameter's type, so the mutation function only needs regenerating
+        # if a subclass supplies its own
+        if self._uses_default_operators():
+            self._population = new_population
+            self._fitness_vec = None
+        else:
+            self.population = new_population
         self.current_generation += 1
         
+        # Evaluate the new generation so its statistics cover every agent
+        self.evaluate_population()
+        
         # Calculate and record statistics for this generation
         self._record_generation_stats()
         
         logger.info(f"Created generation {self.current_generation}")
     
+    def _uses_default_operators(self) -> bool:
+        """Whether every agent is of one class that keeps Agent's mutate and crossover"""
+        agent_type = type(self.population[0]) if self.population else Agent
+        return (agent_type.mutate is Agent.mutate
+                and agent_type.crossover is Agent.crossover
+                and all(type(agent) is agent_type for agent in self.population))
+    
     def _record_generation_stats(self) -> None:
         """Record statistics for the current generation"""
-        fitnesses = [agent.fitness for agent in self.population if agent.fitness is not None]
-        if not fitnesses:
+        if self._fitness_vec is not None:
+            fitnesses = self._fitness_vec
+            best_agent = self.population[int(fitnesses.argmax())] if fitnesses.size else None
+        else:
+            fitnesses = self._fitness_array()
+            best_agent = None
+        if not fitnesses.size:
             logger.warning("No fitness values available to record generation stats")
             return
         
-        best_fitness = max(fitnesses)
-        avg_fitness = sum(fitnesses) / len(fitnesses)
+        best_fitness = fitnesses.max()
+        avg_fitness = fitnesses.mean()
         
         # Calculate a simple diversity metric (standard deviation of fitness)
-        diversity = np.std(fitnesses) if len(fitnesses) > 1 else 0
+        diversity = fitnesses.std() if fitnesses.size > 1 else 0
         
         self.history.add_generation(
             generation=self.current_generation,
             population=self.population,
             best_fitness=best_fitness,
             avg_fitness=avg_fitness,
-            diversity_metric=diversity
+            diversity_metric=diversity,
+            best_agent=best_agent
         )
     
     def evolve(self, generations: int) -> EvolutionHistory:
@@ -210,10 +624,8 @@ class EvolutionEngine:
         if not self.population:
             raise ValueError("Population is empty")
             
-        # Ensure all agents have been evaluated
-        self.evaluate_population()
-        
-        return max(self.population, key=lambda agent: agent.fitness)
+        # Read the fitness of the current members, evaluating any without one
+        return self.population[int(self._current_fitness_vec().argmax())]
     
     def get_diversity_metrics(self) -> Dict[str, float]:
         """
@@ -225,12 +637,73 @@ class EvolutionEngine:
         if not self.population or len(self.population) < 2:
             return {"fitness_std": 0, "fitness_range": 0}
         
-        fitnesses = [agent.fitness for agent in self.population if agent.fitness is not None]
+        fitnesses = self._fitness_array()
+        if fitnesses.size < 2:
+            return {"fitness_std": 0, "fitness_range": 0}
         
         return {
-            "fitness_std": np.std(fitnesses),
-            "fitness_range": max(fitnesses) - min(fitnesses),
-            "fitness_mean": np.mean(fitnesses),
+            "fitness_std": fitnesses.std(),
+            "fitness_range": np.ptp(fitnesses),
+            "fitness_mean": fitnesses.mean(),
             "fitness_median": np.median(fitnesses)
         }
-
+    
+    def snapshot(self) -> Tuple[bytes, List[pickle.PickleBuffer]]:
+        """
+        Serialise the population and evolution state for checkpointing.
+        
+        The state is pickled with protocol 5 and NumPy arrays in it (the
+        fitness vector and any array-valued parameters or metrics) are
+        handed out-of-band, so their data is returned as buffers over the
+        live arrays instead of being copied into the payload. Write the
+        buffers out before the engine changes again.
+        
+        Returns:
+            The pickle payload and its out-of-band buffers, to be passed
+            together to load()
+        """
+        state = {
+            "current_generation": self.current_generation,
+            "rng_state": self.rng.bit_generator.state,
+            "history": self.history,
+            "population": self.population,
+            "fitness": self._fitness_vec
+        }
+        buffers: List[pickle.PickleBuffer] = []
+        payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+        return payload, buffers
+    
+    def load(self, payload: bytes, buffers: Sequence[Any] = ()) -> None:
+        """
+        Restore the population and evolution state from snapshot().
+        
+        The snapshot is unpickled, which can run arbitrary code, so only load
+        data from a trusted source. Agents are recreated by pickle, without
+        calling their constructor, and get back every attribute they had.
+        
+        Args:
+            payload: Pickle payload returned by snapshot()
+            buffers: Out-of-band buffers returned by snapshot(), or any
+                bytes-like objects holding the same data
+            
+        Raises:
+            ValueError: If the snapshot's population size differs from
+                population_size
+        """
+        state = pickle.loads(payload, buffers=buffers)
+        
+        population = state["population"]
+        if len(population) != self.population_size:
+            raise ValueError(f"Snapshot holds {len(population)} agents, "
+                             f"expected population_size {self.population_size}")
+        
+        self.population = population
+        self.current_generation = state["current_generation"]
+        self.rng.bit_generator.state = state["rng_state"]
+        self.history = state["history"]
+        self._fitness_vec = state["fitness"]
+        
+        # perf_counter values from the saving process mean nothing here, so
+        # continue elapsed_time from where the snapshot left off
+        last_stats = self.history.get_last_generation_stats()
+        self.history.start_counter = time.perf_counter() - last_stats.get("elapsed_time", 0.0)
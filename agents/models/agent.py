@@ -1,7 +1,23 @@
 import uuid
 import random
 import copy
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any
+
+import numpy as np
+
+from agents.mutation_kernel import mutate_bools, mutate_floats, mutate_ints
+
+
+# Parameter value types that can be copied without a deep copy
+_PRIMITIVE_TYPES = (bool, int, float, str, type(None))
+
+# Mutation packs values into arrays for the kernels only for large schemas
+# mutated at high rates; below either bound the per-key loop is faster
+_ARRAY_MUTATION_MIN_PARAMS = 256
+_ARRAY_MUTATION_MIN_RATE = 0.5
+
+# Generator for array and mutate_fn draws when no rng is passed in
+_DEFAULT_RNG = np.random.default_rng()
 
 
 class Agent:
@@ -12,6 +28,12 @@ class Agent:
     that can evolve over time through genetic operations (mutation, crossover).
     """
     
+    __slots__ = (
+        "id", "strategy_params", "generation", "parent_ids", "metrics",
+        "fitness_score", "fitness", "mutation_rate", "is_elite",
+        "creation_timestamp", "last_evaluation_timestamp", "active"
+    )
+    
     def __init__(
         self, 
         strategy_params: Dict[str, Any], 
@@ -43,6 +65,7 @@ class Agent:
         
         # Genetic properties
         self.fitness_score = 0.0
+        self.fitness: Optional[float] = None  # Set by the evolution engine
         self.mutation_rate = 0.05  # Default mutation rate
         self.is_elite = False      # Flag for elite agents that are preserved
         
@@ -51,71 +74,142 @@ class Agent:
         self.last_evaluation_timestamp = None
         self.active = True
     
-    def mutate(self, mutation_rate: Optional[float] = None) -> None:
+    def mutate(
+        self, 
+        mutation_rate: Optional[float] = None,
+        rng: Optional[np.random.Generator] = None,
+        mutate_fn: Optional[Callable[..., bool]] = None,
+        draws: Optional[Sequence[float]] = None
+    ) -> None:
         """
         Apply random mutations to the agent's strategy parameters.
         
+        If any parameter changes, the agent's fitness is cleared so it is
+        re-evaluated; otherwise the existing fitness is kept.
+        
         Args:
             mutation_rate: Probability of each parameter being mutated
+            rng: Random number generator, e.g. the evolution engine's; the
+                random module is used if not given
+            mutate_fn: Mutation function specialised for this agent's parameter
+                schema (see build_mutate_function), used instead of the loop
+            draws: Pre-drawn uniform floats for mutate_fn, mutate_fn.n_draws
+                of them; drawn from rng if not given
         """
         rate = mutation_rate if mutation_rate is not None else self.mutation_rate
+        params = self.strategy_params
+        
+        if mutate_fn is not None:
+            if draws is None:
+                draws = (rng if rng is not None else _DEFAULT_RNG).random(
+                    mutate_fn.n_draws).tolist()
+            if mutate_fn(params, rate, draws):
+                self.fitness = None
+            return
         
-        for key in self.strategy_params:
-            # Apply mutation with probability = mutation_rate
-            if random.random() < rate:
-                param_value = self.strategy_params[key]
-                
-                # Handle different parameter types
-                if isinstance(param_value, bool):
-                    # Flip boolean values
-                    self.strategy_params[key] = not param_value
-                elif isinstance(param_value, int):
-                    # Adjust integers by ±10%
-                    adjustment = max(1, int(abs(param_value) * 0.1))
-                    self.strategy_params[key] = param_value + random.randint(-adjustment, adjustment)
-                elif isinstance(param_value, float):
-                    # Adjust floats by ±10%
-                    adjustment = abs(param_value) * 0.1
-                    self.strategy_params[key] = param_value + random.uniform(-adjustment, adjustment)
+        if len(params) >= _ARRAY_MUTATION_MIN_PARAMS and rate >= _ARRAY_MUTATION_MIN_RATE:
+            try:
+                self._mutate_arrays(rate, rng if rng is not None else _DEFAULT_RNG)
+                return
+            except OverflowError:
+                pass  # Integers beyond int64; mutate them one by one below
+        
+        # One batch of draws covers the gate and delta of every parameter
+        if rng is None:
+            draw = random.random
+        else:
+            draw = iter(rng.random(2 * len(params)).tolist()).__next__
+        
+        changed = False
+        for key, param_value in params.items():
+            if draw() >= rate:
+                continue
+            if isinstance(param_value, bool):
+                # Flip boolean values
+                new_value = not param_value
+            elif isinstance(param_value, int):
+                # Adjust integers by ±10% (at least ±1)
+                adjustment = max(1, int(abs(param_value) * 0.1))
+                new_value = param_value + int(draw() * (2 * adjustment + 1)) - adjustment
+            elif isinstance(param_value, float):
+                # Adjust floats by ±10%
+                new_value = param_value + abs(param_value) * 0.1 * (2.0 * draw() - 1.0)
+            else:
+                continue
+            if new_value != param_value:
+                params[key] = new_value
+                changed = True
+        
+        if changed:
+            self.fitness = None
     
-    @classmethod
-    def crossover(cls, agent1: 'Agent', agent2: 'Agent') -> 'Agent':
+    def _mutate_arrays(self, rate: float, rng: np.random.Generator) -> None:
+        """Mutate the parameters through packed per-type arrays and the mutation kernels."""
+        bool_keys, int_keys, float_keys = [], [], []
+        for key, param_value in self.strategy_params.items():
+            if isinstance(param_value, bool):
+                bool_keys.append(key)
+            elif isinstance(param_value, int):
+                int_keys.append(key)
+            elif isinstance(param_value, float):
+                float_keys.append(key)
+        
+        # Pack everything first so an int64 overflow leaves the parameters untouched
+        packed = [(keys, np.fromiter((self.strategy_params[key] for key in keys),
+                                     dtype=dtype, count=len(keys)), kernel)
+                  for keys, dtype, kernel in zip((bool_keys, int_keys, float_keys),
+                                                 (np.bool_, np.int64, np.float64),
+                                                 (mutate_bools, mutate_ints, mutate_floats))
+                  if keys]
+        for keys, values, kernel in packed:
+            if kernel(values, rate, rng):
+                self.strategy_params.update(zip(keys, values.tolist()))
+                self.fitness = None
+    
+    def crossover(self, other: 'Agent', rng: Optional[np.random.Generator] = None) -> 'Agent':
         """
-        Create a new agent by combining strategy parameters from two parent agents.
+        Create a new agent by combining strategy parameters from this agent and another.
         
         Args:
-            agent1: First parent agent
-            agent2: Second parent agent
+            other: Second parent agent
+            rng: Random number generator used to pick each parameter's parent
             
         Returns:
             A new Agent instance with combined strategy parameters
         """
-        # Create a new parameter set by selecting from either parent
-        new_params = {}
-        all_keys = set(agent1.strategy_params.keys()) | set(agent2.strategy_params.keys())
-        
-        for key in all_keys:
-            # Randomly select parameter from either parent
-            if key in agent1.strategy_params and key in agent2.strategy_params:
-                # If both parents have the parameter, randomly select one or average them
-                if random.random() < 0.5:
-                    new_params[key] = agent1.strategy_params[key]
-                else:
-                    new_params[key] = agent2.strategy_params[key]
-            elif key in agent1.strategy_params:
-                new_params[key] = agent1.strategy_params[key]
-            else:
-                new_params[key] = agent2.strategy_params[key]
+        params1 = self.strategy_params
+        params2 = other.strategy_params
+        
+        if params1.keys() == params2.keys():
+            # Parents share a schema: pick every parameter from either parent
+            # using a single batch of random draws
+            draws = rng.random(len(params1)) if rng is not None else [
+                random.random() for _ in range(len(params1))]
+            new_params = {
+                key: params1[key] if draw < 0.5 else params2[key]
+                for key, draw in zip(params1, draws)
+            }
+        else:
+            # Parameters present in only one parent are inherited from it.
+            # Shared keys are walked in params1's order, not set order, so a
+            # seeded rng gives the same child in every process
+            new_params = {**params2, **params1}
+            shared = [key for key in params1 if key in params2]
+            draws = rng.random(len(shared)) if rng is not None else [
+                random.random() for _ in range(len(shared))]
+            for key, draw in zip(shared, draws):
+                if draw >= 0.5:
+                    new_params[key] = params2[key]
         
         # Create a child agent with the new parameters
-        child = cls(
+        child = type(self)(
             strategy_params=new_params,
-            generation=max(agent1.generation, agent2.generation) + 1,
-            parent_ids=[agent1.id, agent2.id]
+            generation=max(self.generation, other.generation) + 1,
+            parent_ids=[self.id, other.id]
         )
         
         # Child inherits average mutation rate from parents
-        child.mutation_rate = (agent1.mutation_rate + agent2.mutation_rate) / 2
+        child.mutation_rate = (self.mutation_rate + other.mutation_rate) / 2
         
         return child
     
@@ -176,8 +270,27 @@ class Agent:
         Returns:
             A new Agent instance with the same attributes
         """
-        clone = copy.deepcopy(self)
+        # Subclasses may carry extra state and non-primitive parameters need
+        # a real deep copy, so only take the fast path for plain agents
+        if type(self) is not Agent or not all(
+                isinstance(value, _PRIMITIVE_TYPES) for value in self.strategy_params.values()):
+            clone = copy.deepcopy(self)
+            clone.id = str(uuid.uuid4())  # Assign a new unique ID
+            return clone
+        
+        clone = Agent.__new__(Agent)
         clone.id = str(uuid.uuid4())  # Assign a new unique ID
+        clone.strategy_params = dict(self.strategy_params)
+        clone.generation = self.generation
+        clone.parent_ids = list(self.parent_ids)
+        clone.metrics = dict(self.metrics)
+        clone.fitness_score = self.fitness_score
+        clone.fitness = self.fitness
+        clone.mutation_rate = self.mutation_rate
+        clone.is_elite = self.is_elite
+        clone.creation_timestamp = self.creation_timestamp
+        clone.last_evaluation_timestamp = self.last_evaluation_timestamp
+        clone.active = self.active
         return clone
     
     def __str__(self) -> str:
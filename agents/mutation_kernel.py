@@ -0,0 +1,191 @@
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# numba is an optional speedup, not listed in requirements.txt. The kernels
+# only run for large schemas mutated at high rates (see Agent.mutate), and
+# the NumPy fallbacks below apply the same rules
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _shift_floats(values: np.ndarray, mask: np.ndarray, draws: np.ndarray) -> bool:
+        """Add up to ±10% to each masked float, drawing the sign and size from draws."""
+        changed = False
+        for i in range(values.size):
+            if mask[i]:
+                delta = abs(values[i]) * 0.1 * (2.0 * draws[i] - 1.0)
+                if delta != 0.0:
+                    values[i] += delta
+                    changed = True
+        return changed
+
+    @njit(cache=True)
+    def _shift_ints(values: np.ndarray, mask: np.ndarray, draws: np.ndarray) -> bool:
+        """Add up to ±10% (at least ±1) to each masked integer, drawing from draws."""
+        changed = False
+        for i in range(values.size):
+            if mask[i]:
+                adjustment = max(1, int(abs(values[i]) * 0.1))
+                delta = int(draws[i] * (2 * adjustment + 1)) - adjustment
+                if delta != 0:
+                    values[i] += delta
+                    changed = True
+        return changed
+
+else:
+
+    def _shift_floats(values: np.ndarray, mask: np.ndarray, draws: np.ndarray) -> bool:
+        """Add up to ±10% to each masked float, drawing the sign and size from draws."""
+        # Only masked entries are touched: multiplying an inf by a zero mask
+        # would turn untouched parameters into nan
+        delta = np.abs(values[mask]) * 0.1 * (2.0 * draws[mask] - 1.0)
+        with np.errstate(invalid="ignore"):  # inf - inf is nan, as in the Python loop
+            values[mask] += delta
+        return bool(delta.any())
+
+    def _shift_ints(values: np.ndarray, mask: np.ndarray, draws: np.ndarray) -> bool:
+        """Add up to ±10% (at least ±1) to each masked integer, drawing from draws."""
+        adjustment = np.maximum(1, (np.abs(values) * 0.1).astype(np.int64))
+        delta = mask * ((draws * (2 * adjustment + 1)).astype(np.int64) - adjustment)
+        values += delta
+        return bool(delta.any())
+
+
+def mutate_floats(values: np.ndarray, rate: float, rng: np.random.Generator) -> bool:
+    """
+    Adjust each float by up to ±10% with probability rate, in place.
+
+    Args:
+        values: Float parameter values
+        rate: Probability of each value being mutated
+        rng: Random number generator
+
+    Returns:
+        True if any value changed
+    """
+    return _shift_floats(values, rng.random(values.size) < rate, rng.random(values.size))
+
+
+def mutate_ints(values: np.ndarray, rate: float, rng: np.random.Generator) -> bool:
+    """
+    Adjust each integer by up to ±10% (at least ±1) with probability rate, in place.
+
+    Args:
+        values: Integer parameter values
+        rate: Probability of each value being mutated
+        rng: Random number generator
+
+    Returns:
+        True if any value changed
+    """
+    return _shift_ints(values, rng.random(values.size) < rate, rng.random(values.size))
+
+
+def mutate_bools(values: np.ndarray, rate: float, rng: np.random.Generator) -> bool:
+    """
+    Flip each boolean with probability rate, in place.
+
+    Args:
+        values: Boolean parameter values
+        rate: Probability of each value being flipped
+        rng: Random number generator
+
+    Returns:
+        True if any value was flipped
+    """
+    mask = rng.random(values.size) < rate
+    values ^= mask
+    return bool(mask.any())
+
+
+def mutation_type(value: Any) -> Optional[type]:
+    """
+    Return the type that decides how a parameter value is mutated.
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        bool, int or float, or None for values that are never mutated
+    """
+    for kind in (bool, int, float):
+        if isinstance(value, kind):
+            return kind
+    return None
+
+
+def build_mutate_function(strategy_params: Dict[str, Any]) -> Optional[Callable[..., bool]]:
+    """
+    Generate a mutation function specialised for a fixed parameter schema.
+
+    The generated function has straight-line code for every bool, int and
+    float parameter of the schema, so no type dispatch or key iteration
+    happens per call. It is called as fn(params, rate, draws), where draws
+    holds fn.n_draws uniform floats in [0, 1), e.g. one row of a batch drawn
+    for the whole generation. It mutates params in place with the same rules
+    as Agent.mutate and returns True if any value changed.
+
+    The caller must make sure every mutated params dict has the schema's
+    keys with values of the same mutation_type.
+
+    Args:
+        strategy_params: Example parameters defining the schema
+
+    Returns:
+        The generated function, or None if the schema has no mutable
+        parameters or keys that are not strings
+    """
+    keys = []
+    for key, value in strategy_params.items():
+        if not isinstance(key, str):
+            return None
+        kind = mutation_type(value)
+        if kind is not None:
+            keys.append((key, kind))
+    if not keys:
+        return None
+
+    # draws[i] gates parameter i and draws[n + i] sizes its adjustment
+    n = len(keys)
+    lines = []
+    for i, (key, kind) in enumerate(keys):
+        if kind is bool:
+            lines.append(
+                f"    if draws[{i}] < rate:\n"
+                f"        params[{key!r}] = not params[{key!r}]\n"
+                f"        changed = True\n")
+        elif kind is int:
+            lines.append(
+                f"    if draws[{i}] < rate:\n"
+                f"        value = params[{key!r}]\n"
+                f"        adjustment = max(1, int(abs(value) * 0.1))\n"
+                f"        delta = int(draws[{n + i}] * (2 * adjustment + 1)) - adjustment\n"
+                f"        if delta:\n"
+                f"            params[{key!r}] = value + delta\n"
+                f"            changed = True\n")
+        else:
+            lines.append(
+                f"    if draws[{i}] < rate:\n"
+                f"        value = params[{key!r}]\n"
+                f"        delta = abs(value) * 0.1 * (2.0 * draws[{n + i}] - 1.0)\n"
+                f"        if delta:\n"
+                f"            params[{key!r}] = value + delta\n"
+                f"            changed = True\n")
+
+    source = (
+        "def mutate_params(params, rate, draws):\n"
+        "    changed = False\n"
+        + "".join(lines)
+        + "    return changed\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<mutate_params>", "exec"), namespace)
+    mutate_params = namespace["mutate_params"]
+    mutate_params.n_draws = 2 * n
+    return mutate_params
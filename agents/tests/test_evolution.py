@@ -0,0 +1,149 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from agents.evolution import EvolutionEngine
+from agents.models.agent import Agent
+
+
+def score(agent):
+    """Deterministic, picklable fitness that also records evaluation fields"""
+    params = agent.strategy_params
+    value = params["x"] - abs(params["n"] - 10) / 10 + (0.1 if params["flag"] else 0.0)
+    agent.metrics = {"score": value}
+    agent.fitness_score = 2 * value
+    agent.last_evaluation_timestamp = 123.0
+    return value
+
+
+def make_factory(seed, opt=1):
+    rng = np.random.default_rng(seed)
+    
+    def factory():
+        return Agent({
+            "flag": bool(rng.random() < 0.5),
+            "n": int(rng.integers(1, 20)),
+            "x": float(rng.random()),
+            "pos_inf": math.inf,
+            "neg_inf": -math.inf,
+            "name": "sma",
+            "opt": opt,
+        })
+    return factory
+
+
+def make_engine(seed=0, **kwargs):
+    kwargs.setdefault("population_size", 30)
+    engine = EvolutionEngine(fitness_function=score, seed=seed, **kwargs)
+    engine.initialize_population(make_factory(seed))
+    return engine
+
+
+class CustomAgent(Agent):
+    __slots__ = ()
+    
+    def mutate(self, mutation_rate=None):
+        super().mutate(mutation_rate)
+
+
+@pytest.mark.parametrize("path", ["generated", "loop", "override"])
+@pytest.mark.parametrize("mutation_rate", [0.0, 1.0])
+def test_breeding_preserves_types_and_non_finite_values(path, mutation_rate):
+    engine = EvolutionEngine(population_size=30, mutation_rate=mutation_rate,
+                             fitness_function=score, seed=3)
+    factory = make_factory(3)
+    agents = iter(range(30))
+    if path == "generated":
+        engine.initialize_population(factory)
+        assert engine._mutate_fn is not None
+    elif path == "loop":
+        # A None in one agent gives the schema no single mutation rule per key
+        engine.initialize_population(
+            lambda: make_factory(3, opt=None if next(agents) == 0 else 1)())
+        assert engine._mutate_fn is None
+    else:
+        engine.initialize_population(lambda: CustomAgent(factory().strategy_params))
+    
+    types = {"flag": bool, "n": int, "x": float, "pos_inf": float, "neg_inf": float,
+             "name": str}
+    engine.evolve(5)
+    for agent in engine.population:
+        params = agent.strategy_params
+        assert {key: type(params[key]) for key in types} == types
+        assert params["name"] == "sma"
+        if mutation_rate == 0.0:
+            assert params["pos_inf"] == math.inf and params["neg_inf"] == -math.inf
+    if path == "override":
+        assert all(type(agent) is CustomAgent for agent in engine.population)
+
+
+def test_seeded_runs_are_reproducible():
+    first, second = make_engine(seed=5), make_engine(seed=5)
+    first.evolve(4)
+    second.evolve(4)
+    assert ([agent.strategy_params for agent in first.population]
+            == [agent.strategy_params for agent in second.population])
+
+
+def test_snapshot_round_trip_continues_seeded_run():
+    engine = make_engine(seed=7)
+    engine.evolve(3)
+    payload, buffers = engine.snapshot()
+    # As if written to disk and read back
+    payload, buffers = bytes(payload), [bytes(buffer.raw()) for buffer in buffers]
+    
+    restored = EvolutionEngine(population_size=30, fitness_function=score, seed=99)
+    restored.load(payload, buffers)
+    assert restored.current_generation == 3
+    assert ([(agent.id, agent.strategy_params, agent.fitness, agent.metrics)
+             for agent in restored.population]
+            == [(agent.id, agent.strategy_params, agent.fitness, agent.metrics)
+                for agent in engine.population])
+    
+    engine.evolve(3)
+    restored.evolve(3)
+    assert ([agent.strategy_params for agent in restored.population]
+            == [agent.strategy_params for agent in engine.population])
+    assert restored.get_best_agent().fitness == engine.get_best_agent().fitness
+    elapsed = [stats["elapsed_time"] for stats in restored.history.generation_stats]
+    assert elapsed == sorted(elapsed) and elapsed[0] >= 0
+
+
+def test_load_rejects_other_population_size():
+    payload, buffers = make_engine().snapshot()
+    with pytest.raises(ValueError):
+        EvolutionEngine(population_size=10, fitness_function=score).load(payload, buffers)
+
+
+@pytest.mark.parametrize("options", [
+    {"n_workers": 2},
+    {"n_workers": 2, "use_threads": True},
+    {"fitness_cache_size": 100},
+])
+def test_evaluation_fields_are_set_on_every_agent(options):
+    values = itertools.cycle([1, 2, 3])
+    with EvolutionEngine(population_size=12, fitness_function=score, **options) as engine:
+        engine.initialize_population(
+            lambda: Agent({"flag": False, "n": next(values), "x": 0.5}))
+        engine.evaluate_population()
+    
+    for agent in engine.population:
+        assert agent.metrics == {"score": agent.fitness}
+        assert agent.fitness_score == 2 * agent.fitness
+        assert agent.last_evaluation_timestamp == 123.0
+    # Agents served from the cache get their own copy of the metrics
+    assert len({id(agent.metrics) for agent in engine.population}) == 12
+
+
+def test_stale_fitness_vector_is_not_used():
+    engine = make_engine()
+    engine.evaluate_population()
+    engine.population = engine.population[:3]
+    assert engine.get_best_agent() in engine.population
+    
+    engine.population[0].strategy_params["x"] = 100.0
+    engine.population[0].fitness = None
+    assert engine.get_best_agent() is engine.population[0]
+    assert engine.tournament_selection().fitness is not None
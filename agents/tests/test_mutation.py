@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+import pytest
+
+from agents.models.agent import Agent
+from agents.mutation_kernel import build_mutate_function, mutate_floats, mutate_ints
+
+
+PARAMS = {"lookback": 20, "window": 3, "threshold": 0.5, "stop": -0.02,
+          "use_stop": True, "short": False, "name": "sma", "extra": None}
+
+
+class ConstantRng:
+    """Generator stand-in returning the same uniform draw everywhere"""
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def random(self, size=None):
+        return self.value if size is None else np.full(size, self.value)
+
+
+@pytest.mark.parametrize("draw", [0.0, 0.25, 0.5, 0.999])
+def test_generated_function_matches_agent_mutate(draw):
+    mutate_fn = build_mutate_function(PARAMS)
+    generated = dict(PARAMS)
+    changed = mutate_fn(generated, 1.0, [draw] * mutate_fn.n_draws)
+    
+    agent = Agent(dict(PARAMS))
+    agent.fitness = 1.0
+    agent.mutate(1.0, rng=ConstantRng(draw))
+    
+    assert generated == agent.strategy_params
+    assert changed == (agent.fitness is None)
+
+
+def test_mutation_rules():
+    mutate_fn = build_mutate_function(PARAMS)
+    lowest, highest = dict(PARAMS), dict(PARAMS)
+    mutate_fn(lowest, 1.0, [0.0] * mutate_fn.n_draws)
+    mutate_fn(highest, 1.0, [0.999999] * mutate_fn.n_draws)
+    
+    # Integers move by up to ±10%, at least ±1; floats by up to ±10%
+    assert (lowest["lookback"], highest["lookback"]) == (18, 22)
+    assert (lowest["window"], highest["window"]) == (2, 4)
+    assert lowest["threshold"] == pytest.approx(0.45)
+    assert highest["stop"] == pytest.approx(-0.018, rel=1e-4)
+    assert lowest["use_stop"] is False and lowest["short"] is True
+    assert lowest["name"] == "sma" and lowest["extra"] is None
+
+
+def test_zero_rate_keeps_parameters_and_fitness():
+    agent = Agent(dict(PARAMS))
+    agent.fitness = 1.0
+    agent.mutate(0.0, rng=np.random.default_rng(0))
+    agent.mutate(0.0, mutate_fn=build_mutate_function(PARAMS))
+    assert agent.strategy_params == PARAMS
+    assert agent.fitness == 1.0
+
+
+def test_mutation_preserves_types():
+    rng = np.random.default_rng(1)
+    mutate_fn = build_mutate_function(PARAMS)
+    for _ in range(50):
+        agent = Agent(dict(PARAMS))
+        agent.mutate(1.0, rng=rng)
+        params = dict(PARAMS)
+        mutate_fn(params, 1.0, rng.random(mutate_fn.n_draws).tolist())
+        for mutated in (agent.strategy_params, params):
+            assert {k: type(v) for k, v in mutated.items()} == {
+                k: type(v) for k, v in PARAMS.items()}
+
+
+def test_array_path_for_large_schemas():
+    params = {f"p{i}": [True, 7, 0.5, "s"][i % 4] for i in range(400)}
+    agent = Agent(dict(params))
+    agent.mutate(1.0, rng=np.random.default_rng(2))
+    assert agent.fitness is None
+    assert {k: type(v) for k, v in agent.strategy_params.items()} == {
+        k: type(v) for k, v in params.items()}
+    
+    # Integers beyond int64 fall back to the per-key loop
+    huge = Agent({f"p{i}": 2**70 + i for i in range(400)})
+    huge.mutate(1.0, rng=np.random.default_rng(2))
+    assert all(isinstance(v, int) for v in huge.strategy_params.values())
+
+
+def test_kernels_leave_unselected_values_untouched():
+    values = np.array([math.inf, -math.inf, 1.0])
+    assert not mutate_floats(values, 0.0, np.random.default_rng(0))
+    assert values[0] == math.inf and values[1] == -math.inf and values[2] == 1.0
+    
+    ints = np.array([5, 100], dtype=np.int64)
+    assert not mutate_ints(ints, 0.0, np.random.default_rng(0))
+    assert ints.tolist() == [5, 100]